@@ -1,17 +1,34 @@
 import os
 import random
 import sys
+import threading
 from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import lru_cache, partial
 from itertools import accumulate
-from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple, Type, cast
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 
+import requests
 from constant_sorrow.constants import CONTRACT_ATTRIBUTE  # type: ignore
 from constant_sorrow.constants import CONTRACT_CALL, TRANSACTION
-from eth_typing.evm import ChecksumAddress
+from eth_typing.evm import BlockIdentifier, ChecksumAddress
 from eth_utils.address import to_checksum_address
+from hexbytes import HexBytes
 from nucypher_core import SessionStaticKey
 from nucypher_core.ferveo import AggregatedTranscript, DkgPublicKey, Transcript
+from web3._utils.abi import get_abi_output_types
 from web3.contract.contract import Contract, ContractFunction
 from web3.types import Timestamp, TxParams, TxReceipt, Wei
 
@@ -38,6 +55,16 @@ from nucypher.types import Agent, NuNits, StakingProviderInfo, TuNits
 from nucypher.utilities.logging import Logger  # type: ignore
 
 
+@lru_cache(maxsize=65536)
+def _checksum_address_from_uint256(address: int) -> ChecksumAddress:
+    """
+    Convert an address returned as a uint256 (e.g. by getActiveStakingProviders())
+    to its EIP-55 checksummed form.  Checksumming runs a keccak hash per address and
+    the same addresses recur across pagination rounds, so the conversion is memoized.
+    """
+    return ChecksumAddress(to_checksum_address(address.to_bytes(ETH_ADDRESS_BYTE_LENGTH, 'big')))
+
+
 class EthereumContractAgent:
     """
     Base class for ethereum contract wrapper types that interact with blockchain contract instances
@@ -52,6 +79,10 @@ class EthereumContractAgent:
     DEFAULT_TRANSACTION_GAS_LIMITS: Dict[str, Optional[Wei]]
     DEFAULT_TRANSACTION_GAS_LIMITS = {'default': None}
 
+    # Maximum number of eth_call objects packed into a single JSON-RPC batch request;
+    # conservative enough to stay under the batch limits of common public nodes.
+    BATCH_REQUEST_SIZE: int = 500
+
     class ContractNotDeployed(Exception):
         """Raised when attempting to access a contract that is not deployed on the current network."""
 
@@ -87,6 +118,7 @@ class EthereumContractAgent:
             )
 
         self.__contract = contract
+        self._function_handles: Dict[str, ContractFunction] = dict()
         self.events = ContractEvents(contract)
         if not transaction_gas:
             transaction_gas = EthereumContractAgent.DEFAULT_TRANSACTION_GAS_LIMITS['default']
@@ -123,6 +155,67 @@ class EthereumContractAgent:
             return None
         return self.contract.functions.owner().call()
 
+    def _contract_function(self, name: str) -> ContractFunction:
+        """
+        Return a bound contract function handle, resolving the ABI entry only once
+        per agent.  Attribute access on `contract.functions` walks the contract ABI
+        on every use, which is measurable overhead in per-index read loops.
+        """
+        try:
+            return self._function_handles[name]
+        except KeyError:
+            handle = getattr(self.contract.functions, name)
+            self._function_handles[name] = handle
+            return handle
+
+    @staticmethod
+    def _decode_contract_call_result(contract_function: ContractFunction, data: bytes) -> Any:
+        """Decode the raw return data of an eth_call made for a contract function."""
+        output_types = get_abi_output_types(contract_function.abi)
+        values = contract_function.w3.codec.decode(output_types, data)
+        values = tuple(to_checksum_address(value) if abi_type == 'address' else value
+                       for abi_type, value in zip(output_types, values))
+        if len(values) == 1:
+            return values[0]
+        return values
+
+    def _batch_contract_calls(self,
+                              contract_functions: List[ContractFunction],
+                              block_identifier: BlockIdentifier = 'latest'
+                              ) -> List[Any]:
+        """
+        Execute a sequence of read-only contract functions over a single JSON-RPC batch
+        request per `BATCH_REQUEST_SIZE` functions, instead of one HTTP round-trip each.
+        Providers without an HTTP endpoint (e.g. testing providers) fall back to
+        sequential calls.
+        """
+        endpoint_uri = getattr(self.blockchain.client.w3.provider, 'endpoint_uri', None)
+        if not endpoint_uri:
+            return [fn.call(block_identifier=block_identifier) for fn in contract_functions]
+
+        if isinstance(block_identifier, int):
+            block_identifier = hex(block_identifier)
+
+        results: List[Any] = list()
+        for start in range(0, len(contract_functions), self.BATCH_REQUEST_SIZE):
+            chunk = contract_functions[start:start + self.BATCH_REQUEST_SIZE]
+            payload = [{'jsonrpc': '2.0',
+                        'id': request_id,
+                        'method': 'eth_call',
+                        'params': [{'to': fn.address, 'data': fn._encode_transaction_data()},
+                                   block_identifier]}
+                       for request_id, fn in enumerate(chunk)]
+            http_response = requests.post(endpoint_uri, json=payload, timeout=self.blockchain.TIMEOUT)
+            http_response.raise_for_status()
+            responses = {response['id']: response for response in http_response.json()}
+            for request_id, fn in enumerate(chunk):
+                response = responses[request_id]
+                error = response.get('error')
+                if error:
+                    raise self.RequirementError(f"Batched call to {fn.fn_name} failed: {error}")
+                results.append(self._decode_contract_call_result(fn, HexBytes(response['result'])))
+        return results
+
 
 class NucypherTokenAgent(EthereumContractAgent):
 
@@ -231,7 +324,7 @@ class SubscriptionManagerAgent(EthereumContractAgent):
     # Calls
     #
 
-    @contract_api(CONTRACT_CALL)
+    @contract_api(CONTRACT_CALL, cache_ttl=300)
     def fee_rate(self) -> Wei:
         result = self.contract.functions.feeRate().call()
         return Wei(result)
@@ -339,7 +432,7 @@ class AdjudicatorAgent(EthereumContractAgent):
     def penalty_history(self, staker_address: str) -> int:
         return self.contract.functions.penaltyHistory(staker_address).call()
 
-    @contract_api(CONTRACT_CALL)
+    @contract_api(CONTRACT_CALL, cache_ttl=300)
     def slashing_parameters(self) -> Tuple[int, ...]:
         parameter_signatures = (
             'hashAlgorithm',                    # Hashing algorithm
@@ -349,10 +442,8 @@ class AdjudicatorAgent(EthereumContractAgent):
             'rewardCoefficient',                # Coefficient for calculating the reward
         )
 
-        def _call_function_by_name(name: str) -> int:
-            return getattr(self.contract.functions, name)().call()
-
-        staking_parameters = tuple(map(_call_function_by_name, parameter_signatures))
+        parameter_functions = [self._contract_function(name)() for name in parameter_signatures]
+        staking_parameters = tuple(self._batch_contract_calls(parameter_functions))
         return staking_parameters
 
 
@@ -362,6 +453,7 @@ class PREApplicationAgent(EthereumContractAgent):
 
     DEFAULT_PROVIDERS_PAGINATION_SIZE_LIGHT_NODE = int(os.environ.get(NUCYPHER_ENVVAR_STAKING_PROVIDERS_PAGINATION_SIZE_LIGHT_NODE, default=30))
     DEFAULT_PROVIDERS_PAGINATION_SIZE = int(os.environ.get(NUCYPHER_ENVVAR_STAKING_PROVIDERS_PAGINATION_SIZE, default=1000))
+    DEFAULT_PAGINATION_WORKERS = 8  # concurrent page fetches for active staking provider pagination
 
     class NotEnoughStakingProviders(Exception):
         pass
@@ -371,12 +463,12 @@ class PREApplicationAgent(EthereumContractAgent):
         confirmed: bool
         start_timestamp: Timestamp
 
-    @contract_api(CONTRACT_CALL)
+    @contract_api(CONTRACT_CALL, cache_ttl=300)
     def get_min_authorization(self) -> int:
         result = self.contract.functions.minAuthorization().call()
         return result
 
-    @contract_api(CONTRACT_CALL)
+    @contract_api(CONTRACT_CALL, cache_ttl=300)
     def get_min_operator_seconds(self) -> int:
         result = self.contract.functions.minOperatorSeconds().call()
         return result
@@ -418,27 +510,57 @@ class PREApplicationAgent(EthereumContractAgent):
         return result
 
     @contract_api(CONTRACT_CALL)
-    def get_staking_providers_population(self) -> int:
-        result = self.contract.functions.getStakingProvidersLength().call()
+    def get_staking_providers_population(self, block_identifier: BlockIdentifier = 'latest') -> int:
+        result = self.contract.functions.getStakingProvidersLength().call(block_identifier=block_identifier)
         return result
 
     @contract_api(CONTRACT_CALL)
     def get_staking_providers(self) -> List[ChecksumAddress]:
         """Returns a list of staking provider addresses"""
         num_providers: int = self.get_staking_providers_population()
-        providers: List[ChecksumAddress] = [self.contract.functions.stakingProviders(i).call() for i in range(num_providers)]
+        staking_providers = self._contract_function('stakingProviders')
+        providers: List[ChecksumAddress] = self._batch_contract_calls(
+            [staking_providers(i) for i in range(num_providers)]
+        )
         return providers
 
     @contract_api(CONTRACT_CALL)
-    def get_active_staking_providers(self, start_index: int, max_results: int) -> Iterable:
-        result = self.contract.functions.getActiveStakingProviders(start_index, max_results).call()
+    def get_active_staking_providers(self,
+                                     start_index: int,
+                                     max_results: int,
+                                     block_identifier: BlockIdentifier = 'latest'
+                                     ) -> Iterable:
+        result = self._contract_function('getActiveStakingProviders')(start_index, max_results).call(
+            block_identifier=block_identifier)
         return result
 
     @contract_api(CONTRACT_CALL)
     def swarm(self) -> Iterable[ChecksumAddress]:
-        for index in range(self.get_staking_providers_population()):
-            address: ChecksumAddress = self.contract.functions.stakingProviders(index).call()
-            yield address
+        staking_providers = self._contract_function('stakingProviders')
+        calls = [staking_providers(index) for index in range(self.get_staking_providers_population())]
+        yield from self._batch_contract_calls(calls)
+
+    def _fetch_active_staking_provider_pages(self,
+                                             num_providers: int,
+                                             pagination_size: int,
+                                             block_identifier: BlockIdentifier = 'latest'
+                                             ) -> Optional[List[Iterable]]:
+        """
+        Fetch all pages of active staking providers concurrently.  Pages are disjoint
+        index ranges, so the per-page calls are independent and latency-bound; overlapping
+        them collapses P sequential round-trips into roughly one.  Returns None if the
+        provider is unsuitable for concurrent requests (e.g. testing providers) so the
+        caller can fall back to serial pagination.
+        """
+        page_starts = list(range(0, num_providers, pagination_size))
+        if len(page_starts) <= 1 or not getattr(self.blockchain.client.w3.provider, 'endpoint_uri', None):
+            return None
+        fetch_page = partial(self.get_active_staking_providers,
+                             max_results=pagination_size,
+                             block_identifier=block_identifier)
+        with ThreadPoolExecutor(max_workers=min(len(page_starts), self.DEFAULT_PAGINATION_WORKERS)) as executor:
+            pages = list(executor.map(fetch_page, page_starts))
+        return pages
 
     @contract_api(CONTRACT_CALL)
     def get_all_active_staking_providers(self, pagination_size: Optional[int] = None) -> Tuple[TuNits, Dict[ChecksumAddress, TuNits]]:
@@ -450,45 +572,61 @@ class PREApplicationAgent(EthereumContractAgent):
             raise ValueError("Pagination size must be >= 0")
 
         if pagination_size > 0:
-            num_providers: int = self.get_staking_providers_population()
-            start_index: int = 0
+            # Pin every page read to one block so the pagination cannot straddle a
+            # state change; single-block reads are also cheaper for the serving node.
+            block_identifier: BlockIdentifier = self.blockchain.client.w3.eth.block_number
+            num_providers: int = self.get_staking_providers_population(block_identifier=block_identifier)
             n_tokens: int = 0
             staking_providers: Dict[int, int] = dict()
-            attempts: int = 0
-            while start_index < num_providers:
-                try:
-                    attempts += 1
-                    active_staking_providers = self.get_active_staking_providers(start_index, pagination_size)
-                except Exception as e:
-                    if 'timeout' not in str(e):
-                        # exception unrelated to pagination size and timeout
-                        raise e
-                    elif pagination_size == 1 or attempts >= 3:
-                        # we tried
-                        raise e
-                    else:
-                        # reduce pagination size and retry
-                        old_pagination_size = pagination_size
-                        pagination_size = old_pagination_size // 2
-                        self.log.debug(f"Failed staking providers sampling using pagination size = {old_pagination_size}."
-                                       f"Retrying with size {pagination_size}")
-                else:
-                    temp_authorized_tokens, temp_staking_providers = active_staking_providers
-                    # temp_staking_providers is a list of length-2 lists (address -> authorized tokens)
-                    temp_staking_providers = {address: authorized_tokens for address, authorized_tokens in temp_staking_providers}
-                    n_tokens = n_tokens + temp_authorized_tokens
+
+            pages = None
+            try:
+                pages = self._fetch_active_staking_provider_pages(num_providers, pagination_size, block_identifier)
+            except Exception as e:
+                if 'timeout' not in str(e):
+                    raise e
+                # fall through to the serial path, which adapts its pagination size
+                self.log.debug(f"Concurrent staking providers pagination timed out. Retrying serially")
+
+            if pages is not None:
+                for temp_authorized_tokens, temp_staking_providers in pages:
+                    n_tokens += temp_authorized_tokens
                     staking_providers.update(temp_staking_providers)
-                    start_index += pagination_size
+
+            else:
+                start_index: int = 0
+                attempts: int = 0
+                while start_index < num_providers:
+                    try:
+                        attempts += 1
+                        active_staking_providers = self.get_active_staking_providers(
+                            start_index, pagination_size, block_identifier=block_identifier)
+                    except Exception as e:
+                        if 'timeout' not in str(e):
+                            # exception unrelated to pagination size and timeout
+                            raise e
+                        elif pagination_size == 1 or attempts >= 3:
+                            # we tried
+                            raise e
+                        else:
+                            # reduce pagination size and retry
+                            old_pagination_size = pagination_size
+                            pagination_size = old_pagination_size // 2
+                            self.log.debug(f"Failed staking providers sampling using pagination size = {old_pagination_size}."
+                                           f"Retrying with size {pagination_size}")
+                    else:
+                        temp_authorized_tokens, temp_staking_providers = active_staking_providers
+                        # temp_staking_providers is a list of length-2 lists (address -> authorized tokens)
+                        temp_staking_providers = {address: authorized_tokens for address, authorized_tokens in temp_staking_providers}
+                        n_tokens = n_tokens + temp_authorized_tokens
+                        staking_providers.update(temp_staking_providers)
+                        start_index += pagination_size
 
         else:
             n_tokens, temp_staking_providers = self.get_active_staking_providers(start_index=0, max_results=0)
             staking_providers = {address: authorized_tokens for address, authorized_tokens in temp_staking_providers}
 
-        # staking provider's addresses are returned as uint256 by getActiveStakingProviders(), convert to address objects
-        def checksum_address(address: int) -> ChecksumAddress:
-            return ChecksumAddress(to_checksum_address(address.to_bytes(ETH_ADDRESS_BYTE_LENGTH, 'big')))
-
-        typed_staking_providers = {checksum_address(address): TuNits(authorized_tokens)
+        typed_staking_providers = {_checksum_address_from_uint256(address): TuNits(authorized_tokens)
                                    for address, authorized_tokens in staking_providers.items()}
 
         return TuNits(n_tokens), typed_staking_providers
@@ -531,11 +669,18 @@ class PREApplicationAgent(EthereumContractAgent):
         return receipt
 
     @contract_api(TRANSACTION)
-    def bond_operator(self, staking_provider: ChecksumAddress, operator: ChecksumAddress, transacting_power: TransactingPower) -> TxReceipt:
+    def bond_operator(self,
+                      staking_provider: ChecksumAddress,
+                      operator: ChecksumAddress,
+                      transacting_power: TransactingPower,
+                      fire_and_forget: bool = False
+                      ) -> Union[TxReceipt, HexBytes]:
         """For use by threshold operator accounts only."""
         contract_function: ContractFunction = self.contract.functions.bondOperator(staking_provider, operator)
         receipt = self.blockchain.send_transaction(contract_function=contract_function,
-                                                   transacting_power=transacting_power)
+                                                   transacting_power=transacting_power,
+                                                   fire_and_forget=fire_and_forget
+                                                   )
         return receipt
 
 
@@ -626,7 +771,7 @@ class CoordinatorAgent(EthereumContractAgent):
 
             return participant_public_keys
 
-    @contract_api(CONTRACT_CALL)
+    @contract_api(CONTRACT_CALL, cache_ttl=300)
     def get_timeout(self) -> int:
         return self.contract.functions.timeout().call()
 
@@ -755,7 +900,8 @@ class ContractAgency:
     """Where agents live and die."""
 
     # TODO: Enforce singleton - #1506 - Okay, actually, make this into a module
-    __agents: Dict[str, Dict[Type[EthereumContractAgent], EthereumContractAgent]] = dict()
+    __agents: Dict[Tuple[str, Type[EthereumContractAgent]], EthereumContractAgent] = dict()
+    __lock = threading.Lock()
 
     @classmethod
     def get_agent(cls,
@@ -769,21 +915,28 @@ class ContractAgency:
             raise TypeError(f"Only agent subclasses can be used from the agency.")
 
         if not registry:
-            if len(cls.__agents) == 1:
-                registry_id = list(cls.__agents.keys()).pop()
+            registry_ids = {registry_id for registry_id, _ in cls.__agents}
+            if len(registry_ids) == 1:
+                registry_id = registry_ids.pop()
             else:
                 raise ValueError("Need to specify a registry in order to get an agent from the ContractAgency")
         else:
             registry_id = registry.id
+        key = (registry_id, agent_class)
         try:
-            return cast(Agent, cls.__agents[registry_id][agent_class])
+            return cast(Agent, cls.__agents[key])
         except KeyError:
-            agent = cast(Agent, agent_class(registry=registry, eth_provider_uri=eth_provider_uri, contract_version=contract_version))
-            cls.__agents[registry_id] = cls.__agents.get(registry_id, dict())
-            cls.__agents[registry_id][agent_class] = agent
-            return agent
+            # Lock so that concurrent callers cannot race into constructing duplicate
+            # agents; each construction opens provider connections.
+            with cls.__lock:
+                agent = cls.__agents.get(key)
+                if agent is None:
+                    agent = agent_class(registry=registry, eth_provider_uri=eth_provider_uri, contract_version=contract_version)
+                    cls.__agents[key] = agent
+            return cast(Agent, agent)
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def _contract_name_to_agent_name(name: str) -> str:
         if name == NUCYPHER_TOKEN_CONTRACT_NAME:
             # TODO: Perhaps rename NucypherTokenAgent
@@ -793,6 +946,13 @@ class ContractAgency:
         agent_name = f"{name}Agent"
         return agent_name
 
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _agent_class_by_name(agent_name: str) -> Type[EthereumContractAgent]:
+        agents_module = sys.modules[__name__]
+        agent_class: Type[EthereumContractAgent] = getattr(agents_module, agent_name)
+        return agent_class
+
     @classmethod
     def get_agent_by_contract_name(cls,
                                    contract_name: str,
@@ -801,8 +961,7 @@ class ContractAgency:
                                    contract_version: Optional[str] = None
                                    ) -> EthereumContractAgent:
         agent_name: str = cls._contract_name_to_agent_name(name=contract_name)
-        agents_module = sys.modules[__name__]
-        agent_class: Type[EthereumContractAgent] = getattr(agents_module, agent_name)
+        agent_class = cls._agent_class_by_name(agent_name)
         agent: EthereumContractAgent = cls.get_agent(
             agent_class=agent_class,
             registry=registry,
@@ -3,6 +3,7 @@
 import eth_utils
 import functools
 import inspect
+import time
 from constant_sorrow.constants import (
     CONTRACT_ATTRIBUTE,
     CONTRACT_CALL,
@@ -112,6 +113,35 @@ def save_receipt(actor_method) -> Callable:  # TODO: rename to "save_result"?
     return wrapped
 
 
+def ttl_cache(ttl: int) -> Callable:
+    """
+    Decorator factory caching an agent method's return value for `ttl` seconds.
+
+    Intended for read-only contract calls whose results change rarely relative to how
+    often they are read (contract parameters, governance settings); each cache hit
+    saves one RPC round-trip. Entries are stored per-instance and keyed by the call
+    arguments, so distinct agents and argument sets do not share results.
+    """
+
+    def decorator(agent_method: Callable) -> Callable:
+
+        @functools.wraps(agent_method)
+        def wrapped(self, *args, **kwargs):
+            cache = self.__dict__.setdefault('_ttl_cache', dict())
+            key = (agent_method.__name__, args, tuple(sorted(kwargs.items())))
+            entry = cache.get(key)
+            now = time.monotonic()
+            if entry is not None and entry[1] > now:
+                return entry[0]
+            result = agent_method(self, *args, **kwargs)
+            cache[key] = (result, now + ttl)
+            return result
+
+        return wrapped
+
+    return decorator
+
+
 #
 # Contract Function Handling
 #
@@ -121,7 +151,8 @@ def save_receipt(actor_method) -> Callable:  # TODO: rename to "save_result"?
 COLLECT_CONTRACT_API = True
 
 
-def contract_api(interface: Optional[ContractInterfaces] = UNKNOWN_CONTRACT_INTERFACE) -> Callable:
+def contract_api(interface: Optional[ContractInterfaces] = UNKNOWN_CONTRACT_INTERFACE,
+                 cache_ttl: Optional[int] = None) -> Callable:
     """Decorator factory for contract API markers"""
 
     def decorator(agent_method: Callable) -> Callable[..., ContractReturnValue]:
@@ -129,10 +160,16 @@ def contract_api(interface: Optional[ContractInterfaces] = UNKNOWN_CONTRACT_INTE
         Marks an agent method as containing contract interactions (transaction or call)
         and validates outbound checksum addresses for EIP-55 compliance.
 
+        If `cache_ttl` is provided, the method's results are additionally cached
+        per-instance for that many seconds (see `ttl_cache`); only appropriate
+        for read-only calls whose results change rarely.
+
         If `COLLECT_CONTRACT_API` is True when running tests,
         all marked methods will be collected for automatic mocking
         and integration with pytest fixtures.
         """
+        if cache_ttl is not None:
+            agent_method = ttl_cache(ttl=cache_ttl)(agent_method)
         if COLLECT_CONTRACT_API:
             agent_method.contract_api = interface
         agent_method = validate_checksum_address(func=agent_method)
@@ -1,13 +1,22 @@
+import requests
 from eth_tester import EthereumTester, PyEVMBackend
 from eth_tester.backends.mock.main import MockBackend
+from requests.adapters import HTTPAdapter
 from typing import Union
 from urllib.parse import urlparse
+from urllib3.util.retry import Retry
 from web3 import HTTPProvider, IPCProvider, WebsocketProvider
 from web3.providers import BaseProvider
 from web3.providers.eth_tester.main import EthereumTesterProvider
 
 from nucypher.exceptions import DevelopmentInstallationRequired
 
+# Connection pool sizing for the HTTP provider session.  Connections are kept alive
+# and reused across contract calls, amortizing TCP/TLS handshakes over many small
+# eth_calls instead of paying one handshake per call.
+HTTP_PROVIDER_POOL_SIZE = 32
+HTTP_PROVIDER_RETRIES = Retry(total=3, backoff_factor=0.1)
+
 
 class ProviderError(Exception):
     pass
@@ -23,7 +32,15 @@ def _get_IPC_provider(eth_provider_uri) -> BaseProvider:
 
 def _get_HTTP_provider(eth_provider_uri) -> BaseProvider:
     from nucypher.blockchain.eth.interfaces import BlockchainInterface
-    return HTTPProvider(endpoint_uri=eth_provider_uri, request_kwargs={'timeout': BlockchainInterface.TIMEOUT})
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=HTTP_PROVIDER_POOL_SIZE,
+                          pool_maxsize=HTTP_PROVIDER_POOL_SIZE,
+                          max_retries=HTTP_PROVIDER_RETRIES)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return HTTPProvider(endpoint_uri=eth_provider_uri,
+                        request_kwargs={'timeout': BlockchainInterface.TIMEOUT},
+                        session=session)
 
 
 def _get_websocket_provider(eth_provider_uri) -> BaseProvider:
@@ -1,8 +1,7 @@
+import hashlib
 from secrets import SystemRandom
 from typing import Union
 
-from cryptography.hazmat.backends.openssl.backend import backend
-from cryptography.hazmat.primitives import hashes
 from eth_account.account import Account
 from eth_account.messages import encode_defunct
 from eth_hash.auto import keccak
@@ -84,10 +83,8 @@ def sha256_digest(*messages: bytes) -> bytes:
     :rtype: bytes
     :return: bytestring of digested data
     """
-    _hash_ctx = hashes.Hash(hashes.SHA256(), backend=backend)
-    for message in messages:
-        _hash_ctx.update(bytes(message))
-    digest = _hash_ctx.finalize()
+    joined_bytes = bytes().join(bytes(message) for message in messages)
+    digest = hashlib.sha256(joined_bytes).digest()
     return digest
 
 
@@ -1,23 +1,30 @@
 
 
-import io
+import os
 import sys
+import time
 import traceback
-from queue import Queue
-from threading import Thread, Event, Lock
+from collections import deque
+from itertools import islice
+from threading import Thread, Event, Lock, Condition
 from typing import Callable, List, Any, Optional, Dict
 
-from constant_sorrow.constants import PRODUCER_STOPPED, TIMEOUT_TRIGGERED
-from twisted.python.threadpool import ThreadPool
+from constant_sorrow.constants import PRODUCER_STOPPED
 
 
 class Success:
+
+    __slots__ = ('value', 'result')
+
     def __init__(self, value, result):
         self.value = value
         self.result = result
 
 
 class Failure:
+
+    __slots__ = ('value', 'exc_info')
+
     def __init__(self, value, exc_info):
         self.value = value
         self.exc_info = exc_info
@@ -27,13 +34,6 @@ class Cancelled(Exception):
     pass
 
 
-class FutureResult:
-
-    def __init__(self, value=None, exc_info=None):
-        self.value = value
-        self.exc_info = exc_info
-
-
 class Future:
     """
     A simplified future object. Can be set to some value (all further sets are ignored),
@@ -44,35 +44,44 @@ class Future:
         self._lock = Lock()
         self._set_event = Event()
         self._value = None
+        self._exception = None
 
-    def _set(self, value):
+    def _set(self, value, exception):
         with self._lock:
             if not self._set_event.is_set():
                 self._value = value
+                self._exception = exception
                 self._set_event.set()
 
     def set(self, value):
-        self._set(FutureResult(value=value))
+        self._set(value, None)
 
     def set_exception(self):
-        exc_info = sys.exc_info()
-        self._set(FutureResult(exc_info=exc_info))
+        # Prepare the exception to raise once, at set time,
+        # so that `get()` is a plain wait-and-raise (or wait-and-return).
+        (exc_type, exc_value, exc_traceback) = sys.exc_info()
+        if exc_value is None:
+            exc_value = exc_type()
+        if exc_value.__traceback__ is not exc_traceback:
+            exc_value = exc_value.with_traceback(exc_traceback)
+        self._set(None, exc_value)
 
     def is_set(self):
         return self._set_event.is_set()
 
+    def wait(self, timeout=None):
+        """
+        Waits for the future to be set, up to an optional timeout;
+        returns whether it was set in time.
+        """
+        return self._set_event.wait(timeout)
+
     def get(self):
         self._set_event.wait()
 
-        if self._value.exc_info is not None:
-            (exc_type, exc_value, exc_traceback) = self._value.exc_info
-            if exc_value is None:
-                exc_value = exc_type()
-            if exc_value.__traceback__ is not exc_traceback:
-                raise exc_value.with_traceback(exc_traceback)
-            raise exc_value
-        else:
-            return self._value.value
+        if self._exception is not None:
+            raise self._exception
+        return self._value
 
 
 class WorkerPoolException(Exception):
@@ -91,13 +100,22 @@ class WorkerPoolException(Exception):
         exc_tracebacks = {}
         for value, exc_info in self.failures.items():
             _, exception, tb = exc_info
-            f = io.StringIO()
-            traceback.print_tb(tb, file=f)
-            exc_tracebacks[value] = f"{f.getvalue()}\n{exception}"
+            exc_tracebacks[value] = f"{''.join(traceback.format_tb(tb))}\n{exception}"
 
         return exc_tracebacks
 
 
+class _DispatchShard:
+    """
+    A slice of a WorkerPool's pending backlog with its own condition,
+    so that worker threads in different shards do not contend on a single dispatch lock.
+    """
+
+    def __init__(self):
+        self.pending = deque()
+        self.ready = Condition()
+
+
 class WorkerPool:
     """
     A generalized class that can start multiple workers in a thread pool with values
@@ -106,6 +124,11 @@ class WorkerPool:
     (a worker returning something without throwing an exception).
     """
 
+    DEFAULT_THREADPOOL_SIZE = 10
+    MAX_IO_THREADPOOL_SIZE = 128
+    THREADS_PER_SHARD = 4
+    STEAL_POLL_INTERVAL = 0.1  # how long an idle worker waits between steal attempts
+
     class TimedOut(WorkerPoolException):
         """Raised if waiting for the target number of successes timed out."""
         def __init__(self, timeout: float, *args, **kwargs):
@@ -125,7 +148,8 @@ class WorkerPool:
                  target_successes,
                  timeout: float,
                  stagger_timeout: float = 0,
-                 threadpool_size: int = None):
+                 threadpool_size: int = None,
+                 io_bound: bool = True):
 
         # TODO: make stagger_timeout a part of the value factory?
 
@@ -135,37 +159,77 @@ class WorkerPool:
         self._stagger_timeout = stagger_timeout
         self._target_successes = target_successes
 
-        thread_pool_kwargs = {}
+        # Worker threads pop pending values straight off deques instead of going
+        # through a thread pool's internal dispatch queue; one condition acquire per
+        # task is the entire dispatch cost.  The backlog is segmented into shards of
+        # THREADS_PER_SHARD workers each, with independent conditions, so dispatch
+        # contention shrinks with the shard count.  Threads (and their shards) are
+        # spawned lazily by the producer as the backlog grows, up to the cap:
+        # the explicit `threadpool_size` if given, otherwise a generous limit for
+        # I/O-bound workers (the typical case — network calls to remote nodes)
+        # or the CPU count for CPU-bound ones.
         if threadpool_size is not None:
-            thread_pool_kwargs['minthreads'] = threadpool_size
-            thread_pool_kwargs['maxthreads'] = threadpool_size
-        self._threadpool = ThreadPool(**thread_pool_kwargs)
-
-        # These three tasks must be run in separate threads
+            self._max_worker_threads = threadpool_size
+        elif io_bound:
+            self._max_worker_threads = self.MAX_IO_THREADPOOL_SIZE
+        else:
+            self._max_worker_threads = os.cpu_count() or self.DEFAULT_THREADPOOL_SIZE
+        # An explicitly requested size is reserved upfront; only the default is lazy.
+        self._preallocate_workers = threadpool_size is not None
+        self._worker_threads = []
+        self._shards = []
+        self._rr_counter = 0  # round-robin dispatch position; only the producer thread advances it
+        self._dispatch_closed = False
+
+        # These two tasks must be run in separate threads
         # to avoid being blocked by workers in the thread pool.
-        self._bail_on_timeout_thread = Thread(target=self._bail_on_timeout)
         self._produce_values_thread = Thread(target=self._produce_values)
         self._process_results_thread = Thread(target=self._process_results)
 
         self._successes = {}
+        self._success_count = 0  # distinct successful values; tracked to avoid re-measuring the dict
         self._failures = {}
         self._started_tasks = 0
         self._finished_tasks = 0
 
         self._cancel_event = Event()
-        self._result_queue = Queue()
+        self._deadline = None  # set on `start()`
+        self._timed_out = False
+        # A single-consumer result channel; a plain deque guarded by a condition
+        # is cheaper than `queue.Queue`, which layers three conditions over its own lock.
+        self._result_deque = deque()
+        self._result_ready = Condition()
         self._target_value = Future()
         self._producer_error = Future()
-        self._results_lock = Lock()
         self._threadpool_stop_lock = Lock()
         self._threadpool_stopped = False
 
     def start(self):
         # TODO: check if already started?
-        self._threadpool.start()
+        self._deadline = time.monotonic() + self._timeout
+        if self._preallocate_workers:
+            while len(self._worker_threads) < self._max_worker_threads:
+                self._spawn_worker()
         self._produce_values_thread.start()
         self._process_results_thread.start()
-        self._bail_on_timeout_thread.start()
+
+    def _spawn_worker(self):
+        index = len(self._worker_threads)
+        if index // self.THREADS_PER_SHARD == len(self._shards):
+            self._shards.append(_DispatchShard())
+        shard = self._shards[index // self.THREADS_PER_SHARD]
+        thread = Thread(target=self._worker_loop, args=(shard,), daemon=True)
+        self._worker_threads.append(thread)
+        thread.start()
+
+    def _grow_workers(self):
+        """
+        Spawns worker threads to match the dispatched backlog, up to the cap.
+        Only called from the producer thread (after `start()` has preallocated
+        any explicitly requested threads).
+        """
+        while len(self._worker_threads) < min(self._max_worker_threads, self._started_tasks):
+            self._spawn_worker()
 
     def cancel(self):
         """
@@ -173,13 +237,60 @@ class WorkerPool:
         """
         self._cancel_event.set()
 
+    def _steal_into(self, shard: _DispatchShard) -> bool:
+        """
+        Move half of a sibling shard's backlog into `shard`, so that skewed worker
+        runtimes do not leave some shards idle while others queue up.
+        Returns whether anything was stolen.  Shard locks are only ever held one at
+        a time, so concurrent thieves cannot deadlock.
+        """
+        for victim in self._shards:
+            if victim is shard:
+                continue
+            with victim.ready:
+                count = len(victim.pending) // 2
+                stolen = [victim.pending.pop() for _ in range(count)]
+            if stolen:
+                with shard.ready:
+                    shard.pending.extend(stolen)
+                    shard.ready.notify(len(stolen) - 1)
+                return True
+        return False
+
+    def _worker_loop(self, shard: _DispatchShard):
+        """
+        The main loop of a worker thread: pop a pending value from the thread's shard
+        and run the worker on it, until dispatch is closed and the backlog is drained.
+        An idle worker whose shard is empty attempts to steal work from its siblings.
+        """
+        while True:
+            have_value = False
+            with shard.ready:
+                if shard.pending:
+                    value = shard.pending.popleft()
+                    have_value = True
+                elif self._dispatch_closed:
+                    return
+            if not have_value:
+                if not self._steal_into(shard):
+                    with shard.ready:
+                        if not shard.pending and not self._dispatch_closed:
+                            shard.ready.wait(self.STEAL_POLL_INTERVAL)
+                continue
+            self._worker_wrapper(value)
+
     def _stop_threadpool(self):
         # This can be called from multiple threads
         # (`join()` itself can be called from multiple threads,
         # and we also attempt to stop the pool from the `_process_results()` thread).
         with self._threadpool_stop_lock:
             if not self._threadpool_stopped:
-                self._threadpool.stop()
+                self._dispatch_closed = True
+                for shard in self._shards:
+                    with shard.ready:
+                        shard.ready.notify_all()
+                for thread in self._worker_threads:
+                    thread.join()
                 self._threadpool_stopped = True
 
     def _check_for_producer_error(self):
@@ -195,7 +306,6 @@ class WorkerPool:
         """
         self._produce_values_thread.join()
         self._process_results_thread.join()
-        self._bail_on_timeout_thread.join()
 
         # In most cases `_threadpool` will be stopped by the `_process_results()` thread.
         # But in case there's some unexpected bug in its code, we're making sure the pool is stopped
@@ -219,34 +329,45 @@ class WorkerPool:
         """
         self._check_for_producer_error()
 
-        result = self._target_value.get()
-        if result == TIMEOUT_TRIGGERED:
+        if not self._timed_out:
+            remaining = self._deadline - time.monotonic()
+            if not self._target_value.wait(max(remaining, 0)):
+                self._timed_out = True
+                self.cancel()
+        if self._timed_out:
             raise self.TimedOut(timeout=self._timeout, failures=self.get_failures())
-        elif result == PRODUCER_STOPPED:
+
+        result = self._target_value.get()
+        if result == PRODUCER_STOPPED:
             raise self.OutOfValues(failures=self.get_failures())
         return result
 
+    # Note on synchronization: `_successes` and `_failures` are written only by the
+    # `_process_results()` thread; readers take snapshot copies.  Both the writes and
+    # `dict.copy()` are atomic under the GIL, so no lock is needed around them.
+
     def get_failures(self) -> Dict:
         """
         Get the current failures, as a dictionary of values to thrown exceptions.
         """
-        with self._results_lock:
-            return dict(self._failures)
+        return dict(self._failures)
 
     def get_successes(self) -> Dict:
         """
         Get the current successes, as a dictionary of values to worker return values.
         """
-        with self._results_lock:
-            return dict(self._successes)
+        return dict(self._successes)
 
-    def _bail_on_timeout(self):
-        """
-        A service thread that cancels the pool on timeout.
-        """
-        if not self._cancel_event.wait(timeout=self._timeout):
-            self._target_value.set(TIMEOUT_TRIGGERED)
-        self._cancel_event.set()
+    def _enqueue_result(self, result):
+        with self._result_ready:
+            self._result_deque.append(result)
+            self._result_ready.notify()
+
+    def _get_result(self):
+        with self._result_ready:
+            while not self._result_deque:
+                self._result_ready.wait()
+            return self._result_deque.popleft()
 
     def _worker_wrapper(self, value):
         """
@@ -254,15 +375,18 @@ class WorkerPool:
         and sends the results to the processing thread.
         """
         try:
-            # If we're in the cancelled state, interrupt early
-            self._sleep(0)
+            # If we're in the cancelled state, interrupt early.
+            # A plain flag read here instead of a zero-timeout `Event.wait()`,
+            # which enters the event's condition lock just to return immediately.
+            if self._cancel_event.is_set():
+                raise Cancelled
 
             result = self._worker(value)
-            self._result_queue.put(Success(value, result))
+            self._enqueue_result(Success(value, result))
         except Cancelled as e:
-            self._result_queue.put(e)
+            self._enqueue_result(e)
         except BaseException as e:
-            self._result_queue.put(Failure(value, sys.exc_info()))
+            self._enqueue_result(Failure(value, sys.exc_info()))
 
     def _process_results(self):
         """
@@ -272,32 +396,34 @@ class WorkerPool:
         producer_stopped = False
         success_event_reached = False
         while True:
-            result = self._result_queue.get()
+            result = self._get_result()
 
             if result == PRODUCER_STOPPED:
                 producer_stopped = True
             else:
                 self._finished_tasks += 1
                 if isinstance(result, Success):
-                    with self._results_lock:
-                        self._successes[result.value] = result.result
-                        len_successes = len(self._successes)
-                    if not success_event_reached and len_successes == self._target_successes:
-                        # A protection for the case of repeating values.
+                    if result.value not in self._successes:
+                        # A protection for the case of repeating values:
+                        # only distinct values count towards the target.
+                        self._success_count += 1
+                    self._successes[result.value] = result.result
+                    if not success_event_reached and self._success_count == self._target_successes:
                         # Only trigger the target value once.
                         success_event_reached = True
-                        self._target_value.set(self.get_successes())
+                        # No copy needed: this loop is the only writer and it stops
+                        # processing results as soon as the target is reached.
+                        self._target_value.set(self._successes)
                 if isinstance(result, Failure):
-                    with self._results_lock:
-                        self._failures[result.value] = result.exc_info
+                    self._failures[result.value] = result.exc_info
 
             if success_event_reached:
                 # no need to continue processing results
-                self.cancel()  # to cancel the timeout thread
+                self.cancel()  # to stop the producer thread
                 break
 
             if producer_stopped and self._finished_tasks == self._started_tasks:
-                self.cancel()  # to cancel the timeout thread
+                self.cancel()  # to stop the producer thread
                 self._target_value.set(PRODUCER_STOPPED)
                 break
 
@@ -306,20 +432,25 @@ class WorkerPool:
     def _produce_values(self):
         while True:
             try:
-                with self._results_lock:
-                    len_successes = len(self._successes)
-                batch = self._value_factory(len_successes)
+                batch = self._value_factory(self._success_count)
                 if not batch:
                     break
 
                 self._started_tasks += len(batch)
+                self._grow_workers()
                 for value in batch:
-                    # There is a possible race between `callInThread()` and `stop()`,
-                    # But we never execute them at the same time,
-                    # because `join()` checks that the producer thread is stopped.
-                    self._threadpool.callInThread(self._worker_wrapper, value)
-
-                self._sleep(self._stagger_timeout)
+                    shard = self._shards[self._rr_counter % len(self._shards)]
+                    self._rr_counter += 1
+                    with shard.ready:
+                        shard.pending.append(value)
+                        shard.ready.notify()
+
+                if self._stagger_timeout:
+                    self._sleep(self._stagger_timeout)
+                elif self._cancel_event.is_set():
+                    # Zero stagger (the default) — keep the cancellation check
+                    # without paying for a timed wait on the event's condition.
+                    raise Cancelled
 
             except Cancelled:
                 break
@@ -329,7 +460,7 @@ class WorkerPool:
                 self.cancel()
                 break
 
-        self._result_queue.put(PRODUCER_STOPPED)
+        self._enqueue_result(PRODUCER_STOPPED)
 
 
 class BatchValueFactory:
@@ -350,7 +481,7 @@ class BatchValueFactory:
                 f"Available values ({len(self.values)} less than required successes {self.required_successes}"
             )
 
-        self._batch_start_index = 0
+        self._remaining_values = iter(self.values)
 
         if batch_size is not None and batch_size <= 0:
             raise ValueError(f"Invalid batch size specified ({batch_size})")
@@ -361,17 +492,7 @@ class BatchValueFactory:
             # no more work needed to be done
             return None
 
-        if self._batch_start_index == len(self.values):
-            # no more values to process
-            return None
-
-        batch_end_index = self._batch_start_index + self.batch_size
-        if batch_end_index <= len(self.values):
-            batch = self.values[self._batch_start_index : batch_end_index]
-            self._batch_start_index = batch_end_index
-            return batch
-        else:
-            # return all remaining values
-            batch = self.values[self._batch_start_index :]
-            self._batch_start_index = len(self.values)
-            return batch
+        # islice yields at most batch_size values and simply runs dry at the end,
+        # so no index arithmetic or remainder branch is needed.
+        batch = list(islice(self._remaining_values, self.batch_size))
+        return batch or None
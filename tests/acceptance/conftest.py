@@ -73,25 +73,41 @@ def staking_providers(testerchain, test_registry, threshold_staking):
     pre_application_agent = ContractAgency.get_agent(PREApplicationAgent, registry=test_registry)
     blockchain = pre_application_agent.blockchain
 
-    staking_providers = list()
-    for provider_address, operator_address in zip(blockchain.stake_providers_accounts, blockchain.ursulas_accounts):
-        provider_power = TransactingPower(account=provider_address, signer=Web3Signer(testerchain.client))
-        provider_power.unlock(password=INSECURE_DEVELOPMENT_PASSWORD)
-
+    # Phase 1: submit all threshold stake initialization transactions without
+    # blocking, then wait on the receipts in a single pass.  The tester backend
+    # mines on submission, so ordering is preserved and each receipt wait is a
+    # pure round trip we only want to pay once per transaction.
+    stake_txhashes = list()
+    for provider_address in blockchain.stake_providers_accounts:
         # for a random amount
         amount = MIN_STAKE_FOR_TESTS + random.randrange(BONUS_TOKENS_FOR_TESTS)
 
         # initialize threshold stake
-        tx = threshold_staking.functions.setRoles(provider_address).transact()
-        testerchain.wait_for_receipt(tx)
-        tx = threshold_staking.functions.setStakes(provider_address, amount, 0, 0).transact()
-        testerchain.wait_for_receipt(tx)
+        stake_txhashes.append(threshold_staking.functions.setRoles(provider_address).transact())
+        stake_txhashes.append(threshold_staking.functions.setStakes(provider_address, amount, 0, 0).transact())
+
+    for txhash in stake_txhashes:
+        testerchain.wait_for_receipt(txhash)
 
-        # We assume that the staking provider knows in advance the account of her operator
-        pre_application_agent.bond_operator(staking_provider=provider_address,
-                                            operator=operator_address,
-                                            transacting_power=provider_power)
+    # Phase 2: bond every operator fire-and-forget, then wait on the bonding
+    # receipts together.  We assume that the staking provider knows in advance
+    # the account of her operator.
+    staking_providers = list()
+    bonding_txhashes = list()
+    for provider_address, operator_address in zip(blockchain.stake_providers_accounts, blockchain.ursulas_accounts):
+        provider_power = TransactingPower(account=provider_address, signer=Web3Signer(testerchain.client))
+        provider_power.unlock(password=INSECURE_DEVELOPMENT_PASSWORD)
+        txhash = pre_application_agent.bond_operator(staking_provider=provider_address,
+                                                     operator=operator_address,
+                                                     transacting_power=provider_power,
+                                                     fire_and_forget=True)
+        bonding_txhashes.append(txhash)
+
+    for txhash in bonding_txhashes:
+        testerchain.wait_for_receipt(txhash)
 
+    # Phase 3: confirm each operator (confirmation is already fire-and-forget).
+    for provider_address, operator_address in zip(blockchain.stake_providers_accounts, blockchain.ursulas_accounts):
         operator_power = TransactingPower(
             account=operator_address, signer=Web3Signer(testerchain.client)
         )
@@ -1,8 +1,9 @@
 import contextlib
+import copy
+import functools
 import json
 import os
 import shutil
-import tempfile
 from datetime import timedelta
 from functools import partial
 from pathlib import Path
@@ -58,31 +59,19 @@ from tests.constants import (
     TESTERCHAIN_CHAIN_ID,
 )
 from tests.mock.interfaces import MockBlockchain, mock_registry_source_manager
-from tests.mock.performance_mocks import (
-    mock_cert_generation,
-    mock_cert_loading,
-    mock_cert_storage,
-    mock_keep_learning,
-    mock_message_verification,
-    mock_record_fleet_state,
-    mock_remember_node,
-    mock_rest_app_creation,
-    mock_verify_node,
-)
 from tests.utils.config import (
     make_alice_test_configuration,
     make_bob_test_configuration,
     make_ursula_test_configuration,
 )
-from tests.utils.middleware import (
-    MockRestMiddleware,
-    MockRestMiddlewareForLargeFleetTests,
-)
+from tests.utils.middleware import MockRestMiddleware
 from tests.utils.policy import generate_random_label
 from tests.utils.ursula import MOCK_KNOWN_URSULAS_CACHE, make_ursulas, select_test_port
 
 test_logger = Logger("test-logger")
 
+_ONE_MILLION_ETHER_IN_WEI = Web3.to_wei(1_000_000, "ether")
+
 # defer.setDebugging(True)
 
 #
@@ -91,27 +80,20 @@ test_logger = Logger("test-logger")
 
 
 @pytest.fixture(scope="function")
-def tempfile_path():
-    fd, path = tempfile.mkstemp()
-    path = Path(path)
-    yield path
-    os.close(fd)
-    path.unlink()
+def tempfile_path(tmp_path):
+    path = tmp_path / "nucypher-tmpfile"
+    path.touch()
+    return path
 
 
 @pytest.fixture(scope="module")
-def temp_dir_path():
-    temp_dir = tempfile.TemporaryDirectory(prefix='nucypher-test-')
-    yield Path(temp_dir.name)
-    temp_dir.cleanup()
+def temp_dir_path(tmp_path_factory):
+    return tmp_path_factory.mktemp("nucypher-test")
 
 
 @pytest.fixture(scope='function')
-def certificates_tempdir():
-    custom_filepath = '/tmp/nucypher-test-certificates-'
-    cert_tmpdir = tempfile.TemporaryDirectory(prefix=custom_filepath)
-    yield Path(cert_tmpdir.name)
-    cert_tmpdir.cleanup()
+def certificates_tempdir(tmp_path_factory):
+    return tmp_path_factory.mktemp("nucypher-test-certificates")
 
 #
 # Accounts
@@ -145,8 +127,7 @@ def ursula_test_config(test_registry, temp_dir_path, testerchain):
     )
     yield config
     config.cleanup()
-    for k in list(MOCK_KNOWN_URSULAS_CACHE.keys()):
-        del MOCK_KNOWN_URSULAS_CACHE[k]
+    MOCK_KNOWN_URSULAS_CACHE.clear()
 
 
 @pytest.fixture(scope="module")
@@ -240,8 +221,11 @@ def capsule_side_channel(enacted_policy):
                 self.plaintexts.append(message)
             return message_kit
 
-        def reset(self, plaintext_passthrough=False):
-            self.enrico = Enrico(encrypting_key=enacted_policy.public_key)
+        def reset(self, plaintext_passthrough=False, fresh_enrico=False):
+            # The policy key is constant for the fixture lifetime, so the
+            # original Enrico is reusable; only rebuild on explicit request.
+            if fresh_enrico:
+                self.enrico = Enrico(encrypting_key=enacted_policy.public_key)
             self.messages.clear()
             self.plaintexts.clear()
             self.plaintext_passthrough = plaintext_passthrough
@@ -307,7 +291,7 @@ def lonely_ursula_maker(ursula_test_config, testerchain):
 #
 
 
-@pytest.fixture(scope='module')
+@pytest.fixture(scope='session')
 def application_economics():
     economics = Economics()
     return economics
@@ -357,13 +341,13 @@ def light_ursula(temp_dir_path, test_registry_source_manager, random_account, mo
     return ursula
 
 
-@pytest.fixture(scope='module')
+@pytest.fixture(scope='session')
 def policy_rate():
     rate = Web3.to_wei(21, 'gwei')
     return rate
 
 
-@pytest.fixture(scope='module')
+@pytest.fixture(scope='session')
 def policy_value(application_economics, policy_rate):
     value = policy_rate * application_economics.min_operator_seconds
     return value
@@ -398,6 +382,17 @@ def get_random_checksum_address():
 def fleet_of_highperf_mocked_ursulas(
     ursula_test_config, request, testerchain, test_registry_source_manager
 ):
+    # Deferred import: the performance mocks construct patch objects against
+    # half the codebase and are only needed by the highperf fixtures.
+    from tests.mock.performance_mocks import (
+        mock_cert_generation,
+        mock_cert_loading,
+        mock_cert_storage,
+        mock_message_verification,
+        mock_remember_node,
+        mock_rest_app_creation,
+    )
+
     mocks = (
         mock_cert_storage,
         mock_cert_loading,
@@ -412,8 +407,15 @@ def fleet_of_highperf_mocked_ursulas(
     except AttributeError:
         quantity = 5000  # Bigass fleet by default; that's kinda the point.
 
-    staking_addresses = (to_checksum_address('0x' + os.urandom(20).hex()) for _ in range(5000))
-    operator_addresses = (to_checksum_address('0x' + os.urandom(20).hex()) for _ in range(5000))
+    # One bulk read from the OS random device instead of one 20-byte syscall
+    # per address; to_checksum_address takes the raw bytes directly.
+    address_buffer = os.urandom(20 * 2 * quantity)
+    addresses = [
+        to_checksum_address(address_buffer[index * 20 : (index + 1) * 20])
+        for index in range(2 * quantity)
+    ]
+    staking_addresses = addresses[:quantity]
+    operator_addresses = addresses[quantity:]
 
     with GlobalLoggerSettings.pause_all_logging_while():
         with contextlib.ExitStack() as stack:
@@ -440,11 +442,19 @@ def fleet_of_highperf_mocked_ursulas(
     yield _ursulas
 
     for ursula in _ursulas:
-        del MOCK_KNOWN_URSULAS_CACHE[ursula.rest_interface.port]
+        MOCK_KNOWN_URSULAS_CACHE.pop(ursula.rest_interface.port, None)
 
 
 @pytest.fixture(scope="module")
 def highperf_mocked_alice(fleet_of_highperf_mocked_ursulas, test_registry_source_manager, monkeymodule, testerchain):
+    from tests.mock.performance_mocks import (
+        mock_cert_storage,
+        mock_keep_learning,
+        mock_message_verification,
+        mock_verify_node,
+    )
+    from tests.utils.middleware import MockRestMiddlewareForLargeFleetTests
+
     monkeymodule.setattr(CharacterConfiguration, 'DEFAULT_PAYMENT_NETWORK', TEMPORARY_DOMAIN)
 
     config = AliceConfiguration(dev_mode=True,
@@ -464,6 +474,14 @@ def highperf_mocked_alice(fleet_of_highperf_mocked_ursulas, test_registry_source
 
 @pytest.fixture(scope="module")
 def highperf_mocked_bob(fleet_of_highperf_mocked_ursulas):
+    from tests.mock.performance_mocks import (
+        mock_cert_storage,
+        mock_keep_learning,
+        mock_record_fleet_state,
+        mock_verify_node,
+    )
+    from tests.utils.middleware import MockRestMiddlewareForLargeFleetTests
+
     config = BobConfiguration(dev_mode=True,
                               domain=TEMPORARY_DOMAIN,
                               network_middleware=MockRestMiddlewareForLargeFleetTests(),
@@ -499,7 +517,7 @@ def test_emitter(mocker):
     return StdoutEmitter()
 
 
-@pytest.fixture(scope='module')
+@pytest.fixture(scope='session')
 def click_runner():
     runner = CliRunner()
     yield runner
@@ -566,7 +584,7 @@ def basic_auth_file(temp_dir_path):
     basic_auth.unlink()
 
 
-@pytest.fixture(scope='module')
+@pytest.fixture(scope='session')
 def mock_rest_middleware():
     return MockRestMiddleware()
 
@@ -576,21 +594,29 @@ def mock_rest_middleware():
 #
 
 
+@functools.lru_cache(maxsize=1)
+def _load_conditions_test_data() -> dict:
+    test_conditions = Path(tests.__file__).parent / "data" / "test_conditions.json"
+    return json.loads(test_conditions.read_text())
+
+
 @pytest.fixture(scope='session')
 def conditions_test_data():
-    test_conditions = Path(tests.__file__).parent / "data" / "test_conditions.json"
-    with open(test_conditions, 'r') as file:
-        data = json.loads(file.read())
+    # Deep-copy so the chain ID patch below (and any in-test mutation)
+    # never leaks back into the cached parse.
+    data = copy.deepcopy(_load_conditions_test_data())
     for name, condition in data.items():
         if condition.get('chain'):
             condition['chain'] = TESTERCHAIN_CHAIN_ID
     return data
 
 
-@pytest.fixture(autouse=True)
-def mock_condition_blockchains(mocker):
+@pytest.fixture(autouse=True, scope='module')
+def mock_condition_blockchains(module_mocker):
     """adds testerchain's chain ID to permitted conditional chains"""
-    mocker.patch.object(
+    # Module-scoped so the patch is in place before module-scoped condition
+    # fixtures (e.g. rpc_condition) are instantiated.
+    module_mocker.patch.object(
         nucypher.policy.conditions.evm, "_CONDITION_CHAINS", tuple([TESTERCHAIN_CHAIN_ID])
     )
 
@@ -603,84 +629,108 @@ def time_condition():
     return condition
 
 
-@pytest.fixture
-def compound_blocktime_lingo():
-    return {
-        "version": ConditionLingo.VERSION,
-        "condition": {
-            "operator": "and",
-            "operands": [
-                {
-                    "returnValueTest": {"value": "0", "comparator": ">"},
-                    "method": "blocktime",
-                    "chain": TESTERCHAIN_CHAIN_ID,
-                },
-                {
-                    "returnValueTest": {
-                        "value": "99999999999999999",
-                        "comparator": "<",
-                    },
-                    "method": "blocktime",
-                    "chain": TESTERCHAIN_CHAIN_ID,
-                },
-                {
-                    "returnValueTest": {"value": "0", "comparator": ">"},
-                    "method": "blocktime",
-                    "chain": TESTERCHAIN_CHAIN_ID,
+# Built once at import; the fixture serves copies so tests can't cross-pollute.
+_COMPOUND_BLOCKTIME_LINGO = {
+    "version": ConditionLingo.VERSION,
+    "condition": {
+        "operator": "and",
+        "operands": [
+            {
+                "returnValueTest": {"value": "0", "comparator": ">"},
+                "method": "blocktime",
+                "chain": TESTERCHAIN_CHAIN_ID,
+            },
+            {
+                "returnValueTest": {
+                    "value": "99999999999999999",
+                    "comparator": "<",
                 },
-            ],
-        },
-    }
+                "method": "blocktime",
+                "chain": TESTERCHAIN_CHAIN_ID,
+            },
+            {
+                "returnValueTest": {"value": "0", "comparator": ">"},
+                "method": "blocktime",
+                "chain": TESTERCHAIN_CHAIN_ID,
+            },
+        ],
+    },
+}
 
 
 @pytest.fixture
-def rpc_condition():
-    condition = RPCCondition(
+def compound_blocktime_lingo():
+    return copy.deepcopy(_COMPOUND_BLOCKTIME_LINGO)
+
+
+@pytest.fixture(scope='module')
+def rpc_condition_factory():
+    """Builds RPC condition variants, sharing one instance per distinct key."""
+
+    @functools.lru_cache(maxsize=None)
+    def build(method, chain, comparator, value, parameters=()):
+        return RPCCondition(
+            method=method,
+            chain=chain,
+            return_value_test=ReturnValueTest(comparator, value),
+            parameters=list(parameters),  # parameters must be a tuple for hashability
+        )
+
+    return build
+
+
+@pytest.fixture(scope='module')
+def rpc_condition(rpc_condition_factory):
+    return rpc_condition_factory(
         method="eth_getBalance",
         chain=TESTERCHAIN_CHAIN_ID,
-        return_value_test=ReturnValueTest("==", Web3.to_wei(1_000_000, "ether")),
-        parameters=[USER_ADDRESS_CONTEXT],
+        comparator="==",
+        value=_ONE_MILLION_ETHER_IN_WEI,
+        parameters=(USER_ADDRESS_CONTEXT,),
     )
-    return condition
 
 
-@pytest.fixture(scope='module')
-def valid_user_address_context():
-    return {
-        USER_ADDRESS_CONTEXT: {
-            "signature": "0x488a7acefdc6d098eedf73cdfd379777c0f4a4023a660d350d3bf309a51dd4251abaad9cdd11b71c400cfb4625c14ca142f72b39165bd980c8da1ea32892ff071c",
-            "address": "0x5ce9454909639D2D17A3F753ce7d93fa0b9aB12E",
-            "typedData": {
-                "primaryType": "Wallet",
-                "types": {
-                    "EIP712Domain": [
-                        {"name": "name", "type": "string"},
-                        {"name": "version", "type": "string"},
-                        {"name": "chainId", "type": "uint256"},
-                        {"name": "salt", "type": "bytes32"},
-                    ],
-                    "Wallet": [
-                        {"name": "address", "type": "string"},
-                        {"name": "blockNumber", "type": "uint256"},
-                        {"name": "blockHash", "type": "bytes32"},
-                        {"name": "signatureText", "type": "string"},
-                    ],
-                },
-                "domain": {
-                    "name": "tDec",
-                    "version": "1",
-                    "chainId": 80001,
-                    "salt": "0x3e6365d35fd4e53cbc00b080b0742b88f8b735352ea54c0534ed6a2e44a83ff0",
-                },
-                "message": {
-                    "address": "0x5ce9454909639D2D17A3F753ce7d93fa0b9aB12E",
-                    "blockNumber": 28117088,
-                    "blockHash": "0x104dfae58be4a9b15d59ce447a565302d5658914f1093f10290cd846fbe258b7",
-                    "signatureText": "I'm the owner of address 0x5ce9454909639D2D17A3F753ce7d93fa0b9aB12E as of block number 28117088",
-                },
+# Built once at import; tests that mutate this context already deepcopy it.
+_VALID_USER_ADDRESS_CONTEXT = {
+    USER_ADDRESS_CONTEXT: {
+        "signature": "0x488a7acefdc6d098eedf73cdfd379777c0f4a4023a660d350d3bf309a51dd4251abaad9cdd11b71c400cfb4625c14ca142f72b39165bd980c8da1ea32892ff071c",
+        "address": "0x5ce9454909639D2D17A3F753ce7d93fa0b9aB12E",
+        "typedData": {
+            "primaryType": "Wallet",
+            "types": {
+                "EIP712Domain": [
+                    {"name": "name", "type": "string"},
+                    {"name": "version", "type": "string"},
+                    {"name": "chainId", "type": "uint256"},
+                    {"name": "salt", "type": "bytes32"},
+                ],
+                "Wallet": [
+                    {"name": "address", "type": "string"},
+                    {"name": "blockNumber", "type": "uint256"},
+                    {"name": "blockHash", "type": "bytes32"},
+                    {"name": "signatureText", "type": "string"},
+                ],
+            },
+            "domain": {
+                "name": "tDec",
+                "version": "1",
+                "chainId": 80001,
+                "salt": "0x3e6365d35fd4e53cbc00b080b0742b88f8b735352ea54c0534ed6a2e44a83ff0",
             },
-        }
+            "message": {
+                "address": "0x5ce9454909639D2D17A3F753ce7d93fa0b9aB12E",
+                "blockNumber": 28117088,
+                "blockHash": "0x104dfae58be4a9b15d59ce447a565302d5658914f1093f10290cd846fbe258b7",
+                "signatureText": "I'm the owner of address 0x5ce9454909639D2D17A3F753ce7d93fa0b9aB12E as of block number 28117088",
+            },
+        },
     }
+}
+
+
+@pytest.fixture(scope='module')
+def valid_user_address_context():
+    return _VALID_USER_ADDRESS_CONTEXT
 
 
 @pytest.fixture(scope='module', autouse=True)
@@ -714,7 +764,7 @@ def ursulas(
     yield _ursulas
 
     for port in _ports_to_remove:
-        del MOCK_KNOWN_URSULAS_CACHE[port]
+        MOCK_KNOWN_URSULAS_CACHE.pop(port, None)
 
     for u in _ursulas:
         u.stop()
@@ -124,16 +124,20 @@ class TesterBlockchain(BlockchainInterface):
     def ether_airdrop(self, amount: int) -> List[str]:
         """Airdrops ether from creator address to all other addresses!"""
         coinbase, *addresses = self.client.accounts
+        eth_amount = Web3().from_wei(amount, 'ether')
+
+        # Submit all transfers up front, then wait for receipts in a second
+        # pass - one round trip per transaction instead of two.
         tx_hashes = list()
         for address in addresses:
             tx = {'to': address, 'from': coinbase, 'value': amount, 'gasPrice': self.w3.eth.generate_gas_price()}
             txhash = self.w3.eth.send_transaction(tx)
-
-            _receipt = self.wait_for_receipt(txhash)
             tx_hashes.append(txhash)
-            eth_amount = Web3().from_wei(amount, 'ether')
             self.log.info("Airdropped {} ETH {} -> {}".format(eth_amount, tx['from'], tx['to']))
 
+        for txhash in tx_hashes:
+            self.wait_for_receipt(txhash)
+
         return tx_hashes
 
     def time_travel(self,